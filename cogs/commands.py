@@ -65,7 +65,7 @@ class Commands(discore.Cog,
             embed.description = t('fixtweet.already_enabled', channel=channel.mention)
             await i.response.send_message(embed=embed, ephemeral=True)
             return
-        TextChannel.find(channel.id).update({'fix_twitter': True})
+        await set_fixtweet_enabled(channel.id, True)
 
         await i.response.send_message(embed=embed)
 
@@ -87,7 +87,7 @@ class Commands(discore.Cog,
             embed.description = t('fixtweet.already_disabled', channel=channel.mention)
             await i.response.send_message(embed=embed, ephemeral=True)
             return
-        TextChannel.find(channel.id).update({'fix_twitter': False})
+        await set_fixtweet_enabled(channel.id, False)
         await i.response.send_message(embed=embed)
 
     @discore.app_commands.command(
@@ -39,7 +39,7 @@ def execute_command(command: str, timeout: int = 30) -> str:
             res.append(stderr)
         res = '\n'.join(res).replace("```", "'''").replace("\n", "¶")
         sanitized_output = shorten(res, width=1992, placeholder='...').replace("¶", "\n")
-    except:
+    except UnicodeDecodeError:
         return "Displaying the command result is impossible"
     return f"```\n{sanitized_output}\n```" if sanitized_output else "Command executed correctly"
 
@@ -52,9 +52,9 @@ class Developer(discore.Cog,
         description="Restart the bot")
     @discore.app_commands.guilds(discore.config.dev_guild)
     async def restart(self, i: discore.Interaction) -> None:
-        i.response.send_message("Restarting...")
+        await i.response.send_message("Restarting...")
         await self.bot.close()
-        await execute_command("pm2 restart chibraxx", timeout=60)
+        execute_command("pm2 restart chibraxx", timeout=60)
         exit(0)
 
     @discore.app_commands.command(
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import re
 import discord_markdown_ast_parser as dmap
 from discord_markdown_ast_parser.parser import NodeType
@@ -17,17 +17,30 @@ tiktok_regex = re.compile(
     r"https?://(?:www\.)?tiktok.com/((?:t|@[\w_]+/video)/(?:[\w_]+))/?(?:\?\S+)?"
 )
 
+link_formatters: Dict[str, Callable[[re.Match[str]], str]] = {
+    'twitter': lambda content:
+        f"[Tweet • {content[1]}]({discore.config.fx_domain}/{content[1]}/status/{content[2]}{content[3] or ''})",
+    'tiktok': lambda content:
+        f"[TikTok]({discore.config.tk_domain}/{content[1]})",
+    'instagram': lambda content:
+        f"[Instagram]({discore.config.ig_domain}/{content[1]})",
+}
 
-def get_embeddable_links(nodes: List[dmap.Node]) -> List[Tuple[re.Match[str], str]]:
+
+def get_embeddable_links(
+        nodes: List[dmap.Node], links: Optional[List[Tuple[re.Match[str], str]]] = None) \
+        -> List[Tuple[re.Match[str], str]]:
     """
     Parse and detects the twitter/X embeddable links, ignoring links
     that are in a code block, in spoiler or ignored with <>
 
     :param nodes: the list of nodes to parse
+    :param links: the list to append the detected links to, used when recursing
     :return: the list of detected links
     """
 
-    links = []
+    if links is None:
+        links = []
     for node in nodes:
         match node.node_type:
             case NodeType.CODE_BLOCK | NodeType.SPOILER | NodeType.CODE_INLINE:
@@ -42,7 +55,7 @@ def get_embeddable_links(nodes: List[dmap.Node]) -> List[Tuple[re.Match[str], st
                     NodeType.URL_WITH_PREVIEW) if url := tiktok_regex.fullmatch(node.url):
                 links.append((url, 'tiktok'))
             case _:
-                links += get_embeddable_links(node.children)
+                get_embeddable_links(node.children, links)
     return links
 
 
@@ -62,20 +75,7 @@ async def fix_embeds(
     if not permissions.send_messages or not permissions.embed_links:
         return
 
-    fixed_links = []
-
-    for link in links:
-        link_type = link[1]
-        content = link[0]
-        if link_type == 'twitter':
-            fixed_links.append(
-                f"[Tweet • {content[1]}]({discore.config.fx_domain}/{content[1]}/status/{content[2]}{content[3] or ''})")
-        elif link_type == 'tiktok':
-            fixed_links.append(
-                f"[TikTok]({discore.config.tk_domain}/{content[1]})")
-        elif link_type == 'instagram':
-            fixed_links.append(
-                f"[Instagram]({discore.config.ig_domain}/{content[1]})")
+    fixed_links = [link_formatters[link_type](content) for content, link_type in links]
 
     await message.reply("\n".join(fixed_links), mention_author=False)
 
@@ -100,7 +100,7 @@ class Events(discore.Cog,
         """
 
         if message.author.bot or not message.content or not message.channel \
-                or not message.guild \
+                or not message.guild or 'http' not in message.content \
                 or not is_fixtweet_enabled(message.guild.id, message.channel.id):
             return
 
@@ -1,9 +1,20 @@
+import asyncio
+from functools import lru_cache
+from time import monotonic
+from typing import OrderedDict, Tuple
+
 from i18n import *
 from i18n.translator import TranslationFormatter, pluralize
 
 from database.models.TextChannel import TextChannel
 from database.models.Guild import Guild
 
+__all__ = ('t', 'translate', 'object_format', 'is_fixtweet_enabled', 'set_fixtweet_enabled')
+
+_FIXTWEET_CACHE_TTL = 60
+_FIXTWEET_CACHE_MAXSIZE = 4096
+_fixtweet_cache: OrderedDict[int, Tuple[bool, float]] = OrderedDict()
+
 
 def t(key, **kwargs):
     """
@@ -15,6 +26,34 @@ def t(key, **kwargs):
     """
 
     locale = kwargs.pop('locale', config.get('locale'))
+    if not kwargs:
+        return _cached_t(key, locale)
+    return _uncached_t(key, locale, **kwargs)
+
+
+@lru_cache(maxsize=512)
+def _cached_t(key, locale):
+    """
+    Translate a key without arguments, memoizing the result per locale
+
+    :param key: The key to translate
+    :param locale: The locale to translate the key in
+    :return: The translated key
+    """
+
+    return _uncached_t(key, locale)
+
+
+def _uncached_t(key, locale, **kwargs):
+    """
+    Translate a key with security, without any memoization
+
+    :param key: The key to translate
+    :param locale: The locale to translate the key in
+    :param kwargs: The arguments to pass to the translation
+    :return: The translated key
+    """
+
     if translations.has(key, locale):
         return translate(key, locale=locale, **kwargs)
     else:
@@ -65,12 +104,36 @@ def object_format(object, **kwargs):
     return object
 
 
+def _cache_fixtweet_state(channel_id: int, state: bool) -> None:
+    """
+    Store the fixtweet state of a channel, evicting the least recently used
+    entry when the cache is full
+    :param channel_id: The id of the channel
+    :param state: The fixtweet state of the channel
+    :return: None
+    """
+
+    _fixtweet_cache[channel_id] = (state, monotonic() + _FIXTWEET_CACHE_TTL)
+    _fixtweet_cache.move_to_end(channel_id)
+    if len(_fixtweet_cache) > _FIXTWEET_CACHE_MAXSIZE:
+        _fixtweet_cache.popitem(last=False)
+
+
 def is_fixtweet_enabled(guild_id: int, channel_id: int) -> bool:
     """
     Check if the fixtweet is enabled for a channel
+    The state is cached for a short time to avoid a database query on every
+    message
     :return: True if the fixtweet is enabled, False otherwise
     """
 
+    cached = _fixtweet_cache.get(channel_id)
+    if cached is not None:
+        if cached[1] > monotonic():
+            _fixtweet_cache.move_to_end(channel_id)
+            return cached[0]
+        del _fixtweet_cache[channel_id]
+
     channel = TextChannel.find(channel_id)
 
     if channel is None:
@@ -79,4 +142,21 @@ def is_fixtweet_enabled(guild_id: int, channel_id: int) -> bool:
             Guild.create({'id': guild_id})
         channel = TextChannel.create({'id': channel_id, 'guild_id': guild_id, 'fix_twitter': True})
 
+    _cache_fixtweet_state(channel_id, channel.fix_twitter)
     return channel.fix_twitter
+
+
+async def set_fixtweet_enabled(channel_id: int, state: bool) -> None:
+    """
+    Enable or disable the fixtweet for a channel, keeping the cache in sync
+    The database write runs in a worker thread, while the cache is only
+    updated from the event loop once the write is done
+    The channel must already exist in the database
+    :param channel_id: The id of the channel to update
+    :param state: True to enable the fixtweet, False to disable it
+    :return: None
+    """
+
+    await asyncio.to_thread(
+        lambda: TextChannel.find(channel_id).update({'fix_twitter': state}))
+    _cache_fixtweet_state(channel_id, state)